@@ -240,7 +240,8 @@ __all__ = ("ScrollView",)
 
 from functools import partial
 from math import isclose
-from enum import Enum
+from sys import intern
+from enum import Enum, IntEnum
 
 from kivy.animation import Animation
 from kivy.config import Config
@@ -300,11 +301,14 @@ class ScrollMode(str, Enum):
     # - UNKNOWN: Initial state, accumulating movement to detect intent
     # - SCROLL: Scroll gesture confirmed - either movement exceeded threshold
     #           OR timeout expired without child widget consuming the touch
+    #
+    # Members are singletons, so the per-event mode checks compare them by
+    # identity rather than going through the str/Enum equality path.
     UNKNOWN = "unknown"  # Detecting intent - accumulating movement
     SCROLL = "scroll"  # Confirmed scroll gesture - movement exceeded threshold
 
 
-class DelegationMode(str, Enum):
+class DelegationMode(IntEnum):
     # """Web-style boundary delegation state machine.
 
     # Controls when an inner ScrollView delegates scrolling to its outer
@@ -346,9 +350,11 @@ class DelegationMode(str, Enum):
     # 2b. User drags up (beyond bottom edge) -> LOCKED (outer takes over)
     # 3. If LOCKED: stays LOCKED, outer handles all further movement
 
-    UNLOCKED = "unlocked"  # Normal scrolling, no delegation active
-    START_AT_BOUNDARY = "start_at_boundary"  # Touch began at scroll boundary
-    LOCKED = "locked"  # At boundary trying to scroll beyond - delegate to outer
+    # Integer values: the mode is compared on every nested touch move.
+
+    UNLOCKED = 0  # Normal scrolling, no delegation active
+    START_AT_BOUNDARY = 1  # Touch began at scroll boundary
+    LOCKED = 2  # At boundary trying to scroll beyond - delegate to outer
 
 
 # =============================================================================
@@ -469,6 +475,22 @@ class ScrollViewHierarchy:
 # to outer ScrollView.
 # Note: Set to 15% to account for elastic overscroll bounce-back
 _BOUNDARY_THRESHOLD = 0.15  # 15% from edge
+# Low and high edges of the boundary zones, precomputed for the checks
+_BOUNDARY_LO = _BOUNDARY_THRESHOLD
+_BOUNDARY_HI = 1.0 - _BOUNDARY_THRESHOLD
+
+# Memoized _classify_nested_configuration results, keyed by the
+# (outer x, outer y, inner x, inner y) do_scroll flags
+_NESTED_CONFIG_CACHE = {}
+
+# Touch movement axes returned by _get_primary_scroll_axis
+_AXIS_NONE = 0
+_AXIS_X = 1
+_AXIS_Y = 2
+
+# Interval bounds (seconds) of the on_scroll_stop velocity check
+_VELOCITY_CHECK_MIN = 1 / 60.0
+_VELOCITY_CHECK_MAX = 0.1
 
 # When we are generating documentation, Config doesn't exist
 _scroll_timeout = _scroll_distance = 0
@@ -587,10 +609,13 @@ class ScrollView(StencilView):
         return (self.do_scroll_x, self.do_scroll_y)
 
     def _set_do_scroll(self, value):
-        if isinstance(value, (list, tuple)):
-            self.do_scroll_x, self.do_scroll_y = value
-        else:
+        try:
+            do_scroll_x, do_scroll_y = value
+        except TypeError:
             self.do_scroll_x = self.do_scroll_y = bool(value)
+            return
+        self.do_scroll_x = do_scroll_x
+        self.do_scroll_y = do_scroll_y
 
     do_scroll = AliasProperty(
         _get_do_scroll,
@@ -624,21 +649,32 @@ class ScrollView(StencilView):
     def _get_vbar(self):
         # must return (y, height) in %
         # calculate the viewport size / scrollview size %
-        if self._viewport is None:
+        vp = self._viewport
+        if vp is None:
             return 0, 1.0
-        vh = self._viewport.height
+        vh = vp.height
         h = self.height
         if vh < h or vh == 0:
             return 0, 1.0
-        ph = max(0.01, h / float(vh))
-        sy = min(1.0, max(0.0, self.scroll_y))
-        py = (1.0 - ph) * sy
-        return (py, ph)
+        # The bar size only changes with the two sizes, not while scrolling
+        if vh != self._vbar_vh or h != self._vbar_h:
+            self._vbar_vh = vh
+            self._vbar_h = h
+            ph = h / vh
+            if ph < 0.01:
+                ph = 0.01
+            self._vbar_ph = ph
+            self._vbar_range = 1.0 - ph
+        sy = self.scroll_y
+        if sy < 0.0:
+            sy = 0.0
+        elif sy > 1.0:
+            sy = 1.0
+        return (self._vbar_range * sy, self._vbar_ph)
 
     vbar = AliasProperty(
         _get_vbar,
         bind=("scroll_y", "_viewport", "viewport_size", "height"),
-        cache=True,
     )
     """Return a tuple of (position, size) of the vertical scrolling bar.
 
@@ -654,21 +690,32 @@ class ScrollView(StencilView):
     def _get_hbar(self):
         # must return (x, width) in %
         # calculate the viewport size / scrollview size %
-        if self._viewport is None:
+        vp = self._viewport
+        if vp is None:
             return 0, 1.0
-        vw = self._viewport.width
+        vw = vp.width
         w = self.width
         if vw < w or vw == 0:
             return 0, 1.0
-        pw = max(0.01, w / float(vw))
-        sx = min(1.0, max(0.0, self.scroll_x))
-        px = (1.0 - pw) * sx
-        return (px, pw)
+        # The bar size only changes with the two sizes, not while scrolling
+        if vw != self._hbar_vw or w != self._hbar_w:
+            self._hbar_vw = vw
+            self._hbar_w = w
+            pw = w / vw
+            if pw < 0.01:
+                pw = 0.01
+            self._hbar_pw = pw
+            self._hbar_range = 1.0 - pw
+        sx = self.scroll_x
+        if sx < 0.0:
+            sx = 0.0
+        elif sx > 1.0:
+            sx = 1.0
+        return (self._hbar_range * sx, self._hbar_pw)
 
     hbar = AliasProperty(
         _get_hbar,
         bind=("scroll_x", "_viewport", "viewport_size", "width"),
-        cache=True,
     )
     """Return a tuple of (position, size) of the horizontal scrolling bar.
 
@@ -901,17 +948,22 @@ class ScrollView(StencilView):
     .. versionadded:: NEXT_VERSION
     """
 
-    # Class constants for mouse wheel scroll button sets
-    _MOUSE_WHEEL_HORIZONTAL = {"scrollleft", "scrollright"}
-    _MOUSE_WHEEL_VERTICAL = {"scrolldown", "scrollup"}
-    _MOUSE_WHEEL_DECREASE = {"scrolldown", "scrollleft"}  # negative direction
-    _MOUSE_WHEEL_INCREASE = {"scrollup", "scrollright"}  # positive direction
+    # Class constant mapping mouse wheel buttons to
+    # (is_vertical, is_increase)
+    _MOUSE_WHEEL_CLASS = {
+        "scrollup": (True, True),
+        "scrolldown": (True, False),
+        "scrollleft": (False, False),
+        "scrollright": (False, True),
+    }
 
     _viewport = ObjectProperty(None, allownone=True)
-    _bar_color = ListProperty([0, 0, 0, 0])
+    _bar_color = ColorProperty([0, 0, 0, 0])
 
     def _set_viewport_size(self, instance, value):
-        self.viewport_size = value
+        # Skip redundant size events so vbar/hbar are not recomputed
+        if value != self.viewport_size:
+            self.viewport_size = value
 
     def on__viewport(self, instance, value):
         if value:
@@ -919,29 +971,57 @@ class ScrollView(StencilView):
             self.viewport_size = value.size
 
     def __init__(self, **kwargs):
+        # touch.ud keys are fixed per instance - build them once instead of
+        # formatting a new string on every touch event
+        self._uid_sv = self._get_uid()
+        self._uid_svavoid = self._get_uid("svavoid")
         self._touch = None
         self._nested_sv_active_touch = (
             None  # Stores the touch that's currently active in nested scenario
         )
         self._trigger_update_from_scroll = Clock.create_trigger(
-            self.update_from_scroll, -1
+            self.update_from_scroll, -1, release_ref=False
+        )
+        # on_scroll_move is coalesced to at most one dispatch per frame
+        self._trigger_scroll_move = Clock.create_trigger(
+            self._dispatch_scroll_move, -1, release_ref=False
+        )
+        # Size and viewport_size changes recompute both effect bounds at most
+        # once per frame
+        self._trigger_update_effect_bounds = Clock.create_trigger(
+            self._update_effect_bounds, -1, release_ref=False
         )
         # For velocity-based stop detection for on_scroll_stop
         self._velocity_check_ev = None
+        self._velocity_check_interval = _VELOCITY_CHECK_MIN
+        self._last_check_speed = None
         self._position_check_ev = None
-        self._last_scroll_pos = None
+        self._last_sx = self._last_sy = None
         self._stable_frames = 0
         # For scroll effect tracking
         self._effect_x_start_width = None
         self._effect_y_start_height = None
-        self._update_effect_bounds_ev = None
         self._bind_inactive_bar_color_ev = None
+        self._bar_color_active = False
+        # Gesture timeout, also re-armed for the slow device retry
+        self._change_touch_mode_ev = None
+        # Whether the viewport is a layout, set in add_widget for scroll_to
+        self._viewport_has_layout = False
+        # Pending scroll_to request while the viewport layout is dirty
+        self._scroll_to_args = None
+        self._scroll_to_ev = None
+        # Scroll bar sizes cached by _get_vbar/_get_hbar, keyed on the sizes
+        self._vbar_vh = self._vbar_h = self._vbar_ph = None
+        self._vbar_range = None
+        self._hbar_vw = self._hbar_w = self._hbar_pw = None
+        self._hbar_range = None
         # create a specific canvas for the viewport
         self.canvas_viewport = Canvas()
         self.canvas = Canvas()
         with self.canvas_viewport.before:
             PushMatrix()
             self.g_translate = Translate(0, 0)
+        self._tx = self._ty = 0.0
         with self.canvas_viewport.after:
             PopMatrix()
 
@@ -951,7 +1031,8 @@ class ScrollView(StencilView):
         self.register_event_type("on_scroll_move")
         self.register_event_type("on_scroll_stop")
 
-        # Bind scroll position changes to dispatch on_scroll_move
+        # Bind scroll position changes to dispatch on_scroll_move and
+        # reposition the content. A single observer per axis does both.
         self.fbind("scroll_x", self._on_scroll_pos_changed)
         self.fbind("scroll_y", self._on_scroll_pos_changed)
 
@@ -968,22 +1049,26 @@ class ScrollView(StencilView):
 
         trigger_update_from_scroll = self._trigger_update_from_scroll
         update_effect_widget = self._update_effect_widget
-        update_effect_x_bounds = self._update_effect_x_bounds
-        update_effect_y_bounds = self._update_effect_y_bounds
+        trigger_update_effect_bounds = self._trigger_update_effect_bounds
         fbind = self.fbind
-        fbind("width", update_effect_x_bounds)
-        fbind("height", update_effect_y_bounds)
-        fbind("viewport_size", self._update_effect_bounds)
+        # size dispatches for width and height changes alike
+        fbind("size", trigger_update_effect_bounds)
+        fbind("viewport_size", trigger_update_effect_bounds)
         fbind("_viewport", update_effect_widget)
-        fbind("scroll_x", trigger_update_from_scroll)
-        fbind("scroll_y", trigger_update_from_scroll)
         fbind("pos", trigger_update_from_scroll)
         fbind("size", trigger_update_from_scroll)
+        fbind("scroll_type", self._update_scroll_type_flags)
 
         trigger_update_from_scroll()
         update_effect_widget()
-        update_effect_x_bounds()
-        update_effect_y_bounds()
+        self._update_effect_bounds()
+        self._update_scroll_type_flags()
+
+    def _update_scroll_type_flags(self, *args):
+        # scroll_type tests done on every touch down, cached as booleans
+        scroll_type = self.scroll_type
+        self._scroll_type_has_bars = "bars" in scroll_type
+        self._scroll_type_bars_only = scroll_type == ["bars"]
 
     def on_effect_x(self, instance, value):
         if value:
@@ -1009,71 +1094,71 @@ class ScrollView(StencilView):
         if self.effect_y:
             self.effect_y.target_widget = self._viewport
 
-    def _update_effect_x_bounds(self, *args):
-        if not self._viewport or not self.effect_x:
-            return
-        scrollable_width = self.width - self.viewport_size[0]
-        self.effect_x.min = 0
-        self.effect_x.max = min(0, scrollable_width)
-        self.effect_x.value = scrollable_width * self.scroll_x
-
-    def _update_effect_y_bounds(self, *args):
-        if not self._viewport or not self.effect_y:
-            return
-        scrollable_height = self.height - self.viewport_size[1]
-        self.effect_y.min = 0 if scrollable_height < 0 else scrollable_height
-        self.effect_y.max = scrollable_height
-        self.effect_y.value = self.effect_y.max * self.scroll_y
-
     def _update_effect_bounds(self, *args):
         # "sync up the physics with reality" method
         # keeps the smooth scrolling effects aligned with the actual SV state
-        self._update_effect_x_bounds()
-        self._update_effect_y_bounds()
+        # Both axes are handled in one pass so the shared state is only read
+        # once.
+        if not self._viewport:
+            return
+        vw, vh = self.viewport_size
+        effect_x = self.effect_x
+        effect_y = self.effect_y
+        if effect_x:
+            scrollable_width = self.width - vw
+            effect_x.min = 0
+            effect_x.max = scrollable_width if scrollable_width < 0 else 0
+            effect_x.value = scrollable_width * self.scroll_x
+        if effect_y:
+            scrollable_height = self.height - vh
+            effect_y.min = 0 if scrollable_height < 0 else scrollable_height
+            effect_y.max = scrollable_height
+            effect_y.value = scrollable_height * self.scroll_y
 
     def _update_effect_x(self, *args):
         vp = self._viewport
-        if not vp or not self.effect_x:
+        effect = self.effect_x
+        if not vp or not effect:
             return
-
-        if self.effect_x.is_manual:
+        if effect.is_manual:
             sw = vp.width - self._effect_x_start_width
         else:
             sw = vp.width - self.width
         if sw < 1 and not (self.always_overscroll and self.do_scroll_x):
             return
+        # The scroll_x observer schedules the reposition
         if sw != 0:
-            sx = self.effect_x.scroll / sw
-            self.scroll_x = -sx
-        self._trigger_update_from_scroll()
+            self.scroll_x = -effect.scroll / sw
 
     def _update_effect_y(self, *args):
         vp = self._viewport
-        if not vp or not self.effect_y:
+        effect = self.effect_y
+        if not vp or not effect:
             return
-        if self.effect_y.is_manual:
+        if effect.is_manual:
             sh = vp.height - self._effect_y_start_height
         else:
             sh = vp.height - self.height
-
         if sh < 1 and not (self.always_overscroll and self.do_scroll_y):
             return
+        # The scroll_y observer schedules the reposition
         if sh != 0:
-            sy = self.effect_y.scroll / sh
-            self.scroll_y = -sy
-        self._trigger_update_from_scroll()
+            self.scroll_y = -effect.scroll / sh
 
+    # The content translation is mirrored in _tx/_ty by _set_translate so the
+    # coordinate transforms below read plain floats instead of the graphics
+    # instruction.
     def to_local(self, x, y, **k):
-        tx, ty = self.g_translate.xy
-        return x - tx, y - ty
+        return x - self._tx, y - self._ty
 
     def to_parent(self, x, y, **k):
-        tx, ty = self.g_translate.xy
-        return x + tx, y + ty
+        return x + self._tx, y + self._ty
 
     def _apply_transform(self, m, pos=None):
-        tx, ty = self.g_translate.xy
-        m.translate(tx, ty, 0)
+        tx = self._tx
+        ty = self._ty
+        if tx or ty:
+            m.translate(tx, ty, 0)
         return super(ScrollView, self)._apply_transform(m, (0, 0))
 
     def _simulate_touch_down(self, touch):
@@ -1099,7 +1184,9 @@ class ScrollView(StencilView):
         return ret
 
     def on_motion(self, etype, me):
-        if me.type_id in self.motion_filter and "pos" in me.profile:
+        # motion_filter is usually empty, test it before the membership checks
+        mf = self.motion_filter
+        if mf and me.type_id in mf and "pos" in me.profile:
             me.push()
             me.apply_transform_2d(self.to_local)
             ret = super().on_motion(etype, me)
@@ -1107,21 +1194,31 @@ class ScrollView(StencilView):
             return ret
         return super().on_motion(etype, me)
 
-    def _delegate_to_children(self, touch, method_name, check_collision=True):
-        # Generic helper function to safely delegate touch events to child
-        # widgets.
+    def _delegate_touch_move_to_children(self, touch):
+        # Safely delegate on_touch_move to child widgets.
         # Handles coordinate transformation and returns the result.
-        # Args:
-        #   touch: The touch event to delegate
-        #   method_name: The method name to call (e.g., 'on_touch_move')
-        #   check_collision: Whether to check collision before delegating
         # Returns: True if any child handled the touch, False otherwise
-        if check_collision and not self.collide_point(*touch.pos):
+        # (including when the touch is outside this ScrollView)
+        x, y = touch.pos
+        if not (self.x <= x <= self.right and self.y <= y <= self.top):
             return False
 
         touch.push()
         touch.apply_transform_2d(self.to_local)
-        res = getattr(super(ScrollView, self), method_name)(touch)
+        res = super(ScrollView, self).on_touch_move(touch)
+        touch.pop()
+        return res
+
+    def _delegate_touch_up_to_children(self, touch):
+        # Safely delegate on_touch_up to child widgets.
+        # Same as _delegate_touch_move_to_children for the touch up.
+        x, y = touch.pos
+        if not (self.x <= x <= self.right and self.y <= y <= self.top):
+            return False
+
+        touch.push()
+        touch.apply_transform_2d(self.to_local)
+        res = super(ScrollView, self).on_touch_up(touch)
         touch.pop()
         return res
 
@@ -1157,16 +1254,14 @@ class ScrollView(StencilView):
         if not viewport.children:
             return None
 
-        # Transform touch to viewport space
-        touch.push()
-        touch.apply_transform_2d(viewport.to_widget)
+        # Transform the touch position to viewport space. The descent only
+        # needs the position, so the touch itself is left untouched instead
+        # of a push/apply_transform_2d/pop round trip.
+        x, y = viewport.to_widget(*touch.pos)
 
-        result = self._find_scrollview_in_widget(viewport, touch)
+        return self._find_scrollview_in_widget(viewport, x, y)
 
-        touch.pop()
-        return result
-
-    def _find_scrollview_in_widget(self, widget, touch):
+    def _find_scrollview_in_widget(self, widget, x, y):
         # Recursively find ScrollView under touch, narrowing by Layout children.
         #
         # When we encounter a widget with children (a Layout), we first
@@ -1176,16 +1271,17 @@ class ScrollView(StencilView):
         #
         # Args:
         #     widget: The widget to search within
-        #     touch: The touch event (already transformed to appropriate space)
+        #     x, y: Touch position, already transformed to viewport space
         #
         # Returns:
         #     ScrollView or None: The first ScrollView found under touch
         # If this widget has children,
         # narrow down which child contains the touch
-        if hasattr(widget, "children") and widget.children:
-            for child in widget.children:
+        children = getattr(widget, "children", None)
+        if children:
+            for child in children:
                 # Skip children that don't collide with touch
-                if not child.collide_point(*touch.pos):
+                if not child.collide_point(x, y):
                     continue
 
                 # Found a colliding child - is it a ScrollView?
@@ -1194,7 +1290,7 @@ class ScrollView(StencilView):
 
                 # Not a ScrollView, but it collides -
                 # recursively search its subtree
-                result = self._find_scrollview_in_widget(child, touch)
+                result = self._find_scrollview_in_widget(child, x, y)
                 if result:
                     return result
 
@@ -1263,14 +1359,14 @@ class ScrollView(StencilView):
         #
         #         Returns (None, None, None) if not in a nested configuration
         #         or if this ScrollView is not found in the hierarchy.
-        if "nested" not in touch.ud:
+        nested = touch.ud.get("nested")
+        if nested is None:
             return None, None, None
 
-        if "hierarchy" not in touch.ud["nested"]:
+        hierarchy = nested.get("hierarchy")
+        if hierarchy is None:
             return None, None, None
 
-        hierarchy = touch.ud["nested"]["hierarchy"]
-
         # Find our index in the hierarchy
         my_index = None
         for i, sv in enumerate(hierarchy.scrollviews):
@@ -1295,17 +1391,19 @@ class ScrollView(StencilView):
         #     touch: Touch event with dx and dy attributes
         #
         # Returns:
-        #     str: 'x' if horizontal movement dominates,
-        #          'y' if vertical movement dominates,
-        #          None if no clear dominance
-        abs_dx = abs(touch.dx)
-        abs_dy = abs(touch.dy)
+        #     int: _AXIS_X if horizontal movement dominates,
+        #          _AXIS_Y if vertical movement dominates,
+        #          _AXIS_NONE (falsy) if no clear dominance
+        dx = touch.dx
+        dy = touch.dy
+        abs_dx = dx if dx >= 0 else -dx
+        abs_dy = dy if dy >= 0 else -dy
 
         if abs_dx > abs_dy:
-            return "x"
+            return _AXIS_X
         elif abs_dy > abs_dx:
-            return "y"
-        return None
+            return _AXIS_Y
+        return _AXIS_NONE
 
     def _classify_nested_configuration(self, child_sv):
         # Classify the nested ScrollView configuration type.
@@ -1324,9 +1422,22 @@ class ScrollView(StencilView):
         #         axis_config: dict with 'shared', 'outer_exclusive',
         #         'inner_exclusive'
         #                     (only for mixed configurations, None otherwise)
-
+        #
+        # The result only depends on the four do_scroll flags, so it is
+        # memoized per flag combination and shared between pairs. The
+        # axis_config dict must be treated as read-only.
         outer_axes = (self.do_scroll_x, self.do_scroll_y)
         inner_axes = (child_sv.do_scroll_x, child_sv.do_scroll_y)
+        key = outer_axes + inner_axes
+        result = _NESTED_CONFIG_CACHE.get(key)
+        if result is None:
+            result = _NESTED_CONFIG_CACHE[key] = self._compute_nested_config(
+                outer_axes, inner_axes
+            )
+        return result
+
+    def _compute_nested_config(self, outer_axes, inner_axes):
+        # Classification behind _classify_nested_configuration.
 
         # Determine configuration type
         is_orthogonal = (
@@ -1365,9 +1476,9 @@ class ScrollView(StencilView):
             inner_exclusive.append("y")
 
         axis_config = {
-            "shared": shared,
-            "outer_exclusive": outer_exclusive,
-            "inner_exclusive": inner_exclusive,
+            "shared": tuple(shared),
+            "outer_exclusive": tuple(outer_exclusive),
+            "inner_exclusive": tuple(inner_exclusive),
         }
 
         return ("mixed", axis_config)
@@ -1385,9 +1496,7 @@ class ScrollView(StencilView):
         #     bool: True if scrolling was successfully initialized,
         #           False if both rejected the touch
 
-        is_wheel = "button" in touch.profile and touch.button.startswith(
-            "scroll"
-        )
+        is_wheel = self._is_wheel_touch(touch)
 
         # Transform touch to inner's PARENT coordinate space
         # (NOT viewport, NOT window - the parent widget that contains the inner)
@@ -1400,7 +1509,7 @@ class ScrollView(StencilView):
             # Inner accepted scrolling (or delegated to child widget)
             # Check if inner actually set up scroll state
             # (not just delegated to button)
-            inner_uid = child_sv._get_uid()
+            inner_uid = child_sv._uid_sv
             if inner_uid in touch.ud:
                 # Inner actually set up scroll state - this is real scrolling
                 # For MOUSE WHEEL: Don't grab or set _touch
@@ -1458,7 +1567,8 @@ class ScrollView(StencilView):
         # Args:
         #     touch: The touch event with touch.ud['nested'] already set
         #     in_bar: Whether touch is in a scrollbar
-        if "nested" not in touch.ud or in_bar:
+        nested = touch.ud.get("nested")
+        if nested is None or in_bar:
             return
 
         # For arbitrary depth: find our immediate parent from hierarchy
@@ -1481,31 +1591,26 @@ class ScrollView(StencilView):
         at_boundary_x = (
             self.do_scroll_x
             and parent_sv.do_scroll_x
-            and self._is_at_scroll_boundary("x")
+            and self._is_at_x_boundary()
         )
 
         # Check Y boundary only if both child and parent scroll vertically
         at_boundary_y = (
             self.do_scroll_y
             and parent_sv.do_scroll_y
-            and self._is_at_scroll_boundary("y")
+            and self._is_at_y_boundary()
         )
 
         # Set delegation_mode based on boundary state in PARALLEL only
         # For arbitrary depth: Store per-ScrollView delegation mode using UID
         if at_boundary_x or at_boundary_y:
             # Store per-ScrollView delegation mode
-            sv_uid = self._get_uid()
-            if "delegation_modes" not in touch.ud["nested"]:
-                touch.ud["nested"]["delegation_modes"] = {}
-            touch.ud["nested"]["delegation_modes"][
-                sv_uid
+            nested.setdefault("delegation_modes", {})[
+                self._uid_sv
             ] = DelegationMode.START_AT_BOUNDARY
 
             # Also set global mode for backward compatibility with 2-level code
-            touch.ud["nested"][
-                "delegation_mode"
-            ] = DelegationMode.START_AT_BOUNDARY
+            nested["delegation_mode"] = DelegationMode.START_AT_BOUNDARY
 
     def _delegate_to_parent_scroll(self, touch, child_sv, parent_sv):
         # Delegate scrolling from child to parent ScrollView in hierarchy chain.
@@ -1525,7 +1630,7 @@ class ScrollView(StencilView):
         # Returns:
         #     bool: Result from parent's _scroll_update
         # Initialize parent's scroll state if not already set up
-        parent_uid = parent_sv._get_uid()
+        parent_uid = parent_sv._uid_sv
         if parent_uid not in touch.ud:
             touch.ud[parent_uid] = {
                 "mode": ScrollMode.SCROLL,  # Already scrolling (not UNKNOWN)
@@ -1534,7 +1639,10 @@ class ScrollView(StencilView):
                 "scroll_action": False,
                 "frames": 0,
                 "can_defocus": False,
+                "in_bar_x": False,
+                "in_bar_y": False,
             }
+            touch.ud["sv.active"] = True
             parent_sv._initialize_scroll_effects(touch, in_bar=False)
             parent_sv._touch = touch
             parent_sv.dispatch("on_scroll_start")
@@ -1546,7 +1654,7 @@ class ScrollView(StencilView):
                 child_sv._finalize_scroll_for_cascade(touch)
 
         # Now process the touch movement with parent
-        touch.ud["sv.handled"] = {"x": False, "y": False}
+        self._reset_handled_axes(touch.ud)
         return parent_sv._scroll_update(touch)
 
     def _detect_scroll_intent(self, touch, ud):
@@ -1604,29 +1712,29 @@ class ScrollView(StencilView):
         #     bool: True if should delegate to parent
         #           False if should continue handling
         # Only check delegation for nested ScrollViews scrolling content
-        if "nested" not in touch.ud:
+        nested = touch.ud.get("nested")
+        if nested is None or not not_in_bar:
             return False
-        if not not_in_bar:
-            return False
-
-        # Get hierarchy and find our position
-        hierarchy, my_index, parent_sv = self._get_nested_data(touch)
 
         # Check if delegation to outer is enabled
         if not self.delegate_to_outer:
             return False  # Delegation disabled - don't cascade to parent
 
+        # Get hierarchy and find our position
+        hierarchy, my_index, parent_sv = self._get_nested_data(touch)
+
         if not hierarchy or parent_sv is None:
             return False  # Not nested or we're the outer - no delegation
 
         # Only check delegation if we're the CURRENT handler in the hierarchy
         # For arbitrary depth: check current_index
         # Check if we're the current handler (hierarchy-based routing)
-        if "current_index" not in touch.ud["nested"]:
+        current_index = nested.get("current_index")
+        if current_index is None:
             # No routing info - shouldn't happen but be safe
             return False
 
-        if my_index != touch.ud["nested"]["current_index"]:
+        if my_index != current_index:
             return False  # Not our turn to handle, don't delegate
 
         # CROSS-AXIS DELEGATION: Check FIRST if gesture is on an axis we can't
@@ -1636,10 +1744,10 @@ class ScrollView(StencilView):
         # to outer XY above
         primary_axis = self._get_primary_scroll_axis(touch)
 
-        if primary_axis == "x" and not self.do_scroll_x:
+        if primary_axis == _AXIS_X and not self.do_scroll_x:
             # Horizontal gesture but we only scroll vertically - delegate upward
             return True
-        if primary_axis == "y" and not self.do_scroll_y:
+        if primary_axis == _AXIS_Y and not self.do_scroll_y:
             # Vertical gesture but we only scroll horizontally - delegate upward
             return True
 
@@ -1658,7 +1766,7 @@ class ScrollView(StencilView):
             # trying to scroll beyond,look for a parallel ancestor further up
             # the hierarchy
             # Example: V->H->V, inner V at boundary should delegate to outer V
-            primary_axis = self._get_primary_scroll_axis(touch)
+            # (primary_axis was computed above from the same touch deltas)
             if primary_axis and self._is_scrolling_beyond_boundary(
                 primary_axis, touch
             ):
@@ -1684,68 +1792,45 @@ class ScrollView(StencilView):
 
         return False
 
-    def _is_at_scroll_boundary(self, axis):
-        # Check if this ScrollView is at a scroll boundary on the given axis.
-        #
-        # Args:
-        #     axis: 'x' or 'y' - the axis to check
-        #
-        # Returns:
-        #     bool: True if at boundary (near 0.0 or 1.0), False otherwise
-        if axis == "x":
-            if not self.do_scroll_x:
-                return False
-            scroll_pos = self.scroll_x
-        elif axis == "y":
-            if not self.do_scroll_y:
-                return False
-            scroll_pos = self.scroll_y
-        else:
-            return False
+    # Boundary checks: scroll_x/scroll_y within the threshold of either end.
+    # Every caller has already tested do_scroll_x/do_scroll_y on the axis
+    # (and usually on the parent too), so they are not re-read here.
+    def _is_at_x_boundary(self):
+        return not (_BOUNDARY_LO < self.scroll_x < _BOUNDARY_HI)
 
-        # At boundary if within threshold of min or max
-        return scroll_pos <= _BOUNDARY_THRESHOLD or scroll_pos >= (
-            1.0 - _BOUNDARY_THRESHOLD
-        )
+    def _is_at_y_boundary(self):
+        return not (_BOUNDARY_LO < self.scroll_y < _BOUNDARY_HI)
 
     def _is_scrolling_beyond_boundary(self, axis, touch):
         # Check if scroll gesture is trying to move beyond the current boundary.
         #
         # Args:
-        #     axis: 'x' or 'y' - the axis to check
+        #     axis: _AXIS_X or _AXIS_Y - the axis to check
         #     touch: The touch event
         #
         # Returns:
         #     bool: True if at boundary AND trying to scroll beyond it
-        if axis == "x":
+        # Pick the axis once, the boundary decision is the same for both.
+        # Touch delta sign is inverted relative to scroll direction:
+        # dragging positive moves toward the low (0.0) end.
+        if axis == _AXIS_X:
             if not self.do_scroll_x:
                 return False
             scroll_pos = self.scroll_x
-            # Check scroll direction from touch movement
-            dx = touch.dx if hasattr(touch, "dx") else (touch.x - touch.px)
-
-            # At left boundary (scroll_x ~= 0.0) trying to scroll further left
-            if scroll_pos <= _BOUNDARY_THRESHOLD and dx > 0:
-                return True
-            # At right boundary (scroll_x ~= 1.0) trying to scroll further right
-            if scroll_pos >= (1.0 - _BOUNDARY_THRESHOLD) and dx < 0:
-                return True
-
-        elif axis == "y":
+            d = touch.dx if hasattr(touch, "dx") else (touch.x - touch.px)
+        elif axis == _AXIS_Y:
             if not self.do_scroll_y:
                 return False
             scroll_pos = self.scroll_y
-            # Check scroll direction from touch movement
-            dy = touch.dy if hasattr(touch, "dy") else (touch.y - touch.py)
-
-            # At top boundary (scroll_y ~= 0.0) trying to scroll further up
-            if scroll_pos <= _BOUNDARY_THRESHOLD and dy > 0:
-                return True
-            # At bottom boundary (scroll_y ~= 1.0) trying to scroll further down
-            if scroll_pos >= (1.0 - _BOUNDARY_THRESHOLD) and dy < 0:
-                return True
+            d = touch.dy if hasattr(touch, "dy") else (touch.y - touch.py)
+        else:
+            return False
 
-        return False
+        # At the low boundary dragging further toward it, or at the high
+        # boundary dragging further toward it
+        return (scroll_pos <= _BOUNDARY_LO and d > 0) or (
+            scroll_pos >= _BOUNDARY_HI and d < 0
+        )
 
     def _find_parallel_ancestor(self, touch, axis):
         # Find nearest ancestor in hierarchy that can scroll on the given axis.
@@ -1759,7 +1844,7 @@ class ScrollView(StencilView):
         #
         # Args:
         #     touch: The touch event
-        #     axis: 'x' or 'y' - the axis to search for
+        #     axis: _AXIS_X or _AXIS_Y - the axis to search for
         #
         # Returns:
         #     tuple: (ancestor_sv, ancestor_index) if found,
@@ -1787,9 +1872,9 @@ class ScrollView(StencilView):
                 return None, None
 
             # Check if this ancestor can handle the axis we need
-            if axis == "x" and ancestor.do_scroll_x:
+            if axis == _AXIS_X and ancestor.do_scroll_x:
                 return ancestor, i
-            if axis == "y" and ancestor.do_scroll_y:
+            if axis == _AXIS_Y and ancestor.do_scroll_y:
                 return ancestor, i
 
         return None, None
@@ -1804,10 +1889,14 @@ class ScrollView(StencilView):
         #     touch: The touch event
         #     uid_key: The unique key for this ScrollView's touch data
 
-        if uid_key in touch.ud and not touch.ud[uid_key].get(
-            "can_defocus", True
-        ):
-            FocusBehavior.ignored_touch.append(touch)
+        # Window removes a touch from the list once, after its touch up.
+        # Nested ScrollViews can each reach here for the same touch, so only
+        # add it once or the extra copies would stay in the list for good.
+        data = touch.ud.get(uid_key)
+        if data is not None and not data.get("can_defocus", True):
+            ignored = FocusBehavior.ignored_touch
+            if touch not in ignored:
+                ignored.append(touch)
 
     def _touch_in_handle(self, pos, size, touch):
         # check if the touch is in the handle of the scrollview
@@ -1818,40 +1907,43 @@ class ScrollView(StencilView):
         width, height = size
         return x <= touch.x <= x + width and y <= touch.y <= y + height
 
-    def _check_scroll_bounds(self, touch):
-        # Check if touch is within scrollable bounds and set in_bar flags.
+    def _compute_scrollable_flags(self):
+        # Return (width_scrollable, height_scrollable) for the current
+        # viewport. The caller must make sure the viewport exists.
         vp = self._viewport
-        if not vp:
-            return False, False
-
-        # Calculate scrollable dimensions
+        always_overscroll = self.always_overscroll
         width_scrollable = (
-            self.always_overscroll and self.do_scroll_x
+            always_overscroll and self.do_scroll_x
         ) or vp.width > self.width
         height_scrollable = (
-            self.always_overscroll and self.do_scroll_y
+            always_overscroll and self.do_scroll_y
         ) or vp.height > self.height
+        return width_scrollable, height_scrollable
 
-        # Calculate distance from touch to scroll bar edges
-        d = {
-            "bottom": touch.y - self.y - self.bar_margin,
-            "top": self.top - touch.y - self.bar_margin,
-            "left": touch.x - self.x - self.bar_margin,
-            "right": self.right - touch.x - self.bar_margin,
-        }
+    def _check_scroll_bounds(self, touch):
+        # Check if touch is within scrollable bounds and set in_bar flags.
+        if not self._viewport or not self._scroll_type_has_bars:
+            return False, False
+
+        # Calculate scrollable dimensions
+        width_scrollable, height_scrollable = self._compute_scrollable_flags()
+
+        # Calculate distance from touch to the edge of each scroll bar
+        tx, ty = touch.pos
+        margin = self.bar_margin
+        bar_width = self.bar_width
+        if self.bar_pos_x == "bottom":
+            dist_x = ty - self.y - margin
+        else:
+            dist_x = self.top - ty - margin
+        if self.bar_pos_y == "right":
+            dist_y = self.right - tx - margin
+        else:
+            dist_y = tx - self.x - margin
 
         # Check if touch is in horizontal or vertical scroll bars
-        scroll_bar = "bars" in self.scroll_type
-        in_bar_x = (
-            scroll_bar
-            and width_scrollable
-            and (0 <= d[self.bar_pos_x] <= self.bar_width)
-        )
-        in_bar_y = (
-            scroll_bar
-            and height_scrollable
-            and (0 <= d[self.bar_pos_y] <= self.bar_width)
-        )
+        in_bar_x = width_scrollable and (0 <= dist_x <= bar_width)
+        in_bar_y = height_scrollable and (0 <= dist_y <= bar_width)
 
         return in_bar_x, in_bar_y
 
@@ -1866,89 +1958,68 @@ class ScrollView(StencilView):
         # handle the direction. No automatic delegation through hierarchy - user
         # must move mouse to scroll a different element. This matches standard
         # web browser UX.
+        if not self._viewport:
+            return False
 
-        if btn in self._MOUSE_WHEEL_HORIZONTAL:
-            # Horizontal wheel: only handle if we can scroll horizontally
-            if not (
-                self.do_scroll_x
-                and (
-                    (self.always_overscroll and self.do_scroll_x)
-                    or (self._viewport and self._viewport.width > self.width)
-                )
-            ):
-                return False  # Can't scroll horizontally, pass to parent
-        elif btn in self._MOUSE_WHEEL_VERTICAL:
+        # Classify the button with a single lookup
+        wheel_class = self._MOUSE_WHEEL_CLASS.get(btn)
+        if wheel_class is None:
+            return False
+        is_vertical, is_increase = wheel_class
+
+        width_scrollable, height_scrollable = self._compute_scrollable_flags()
+        if is_vertical:
             # Vertical wheel: only handle if we can scroll vertically
-            if not (
-                self.do_scroll_y
-                and (
-                    (self.always_overscroll and self.do_scroll_y)
-                    or (self._viewport and self._viewport.height > self.height)
-                )
-            ):
+            if not (self.do_scroll_y and height_scrollable):
                 return False  # Can't scroll vertically, pass to parent
-
-        # Select appropriate scroll effect
-        e = self._select_scroll_effect_for_wheel(btn, in_bar_x, in_bar_y)
+        elif not (self.do_scroll_x and width_scrollable):
+            # Horizontal wheel: only handle if we can scroll horizontally
+            return False  # Can't scroll horizontally, pass to parent
+
+        # Select appropriate scroll effect from the axis flag, with the same
+        # None handling as the former _select_scroll_effect_for_wheel
+        if is_vertical:
+            e = self.effect_x
+            if e and not in_bar_x:
+                e = self.effect_y
+        else:
+            e = self.effect_y
+            if e and not in_bar_y:
+                e = self.effect_x
         if not e:
             return False
 
         # Dispatch on_scroll_start for mouse wheel scrolling
         self.dispatch("on_scroll_start")
-        self._apply_wheel_scroll(e, btn, m)
+        self._apply_wheel_scroll(e, is_increase, m)
         e.trigger_velocity_update()
         return True
 
-    def _select_scroll_effect_for_wheel(self, btn, in_bar_x, in_bar_y):
-        # Select the appropriate scroll effect for mouse wheel scrolling.
-        vp = self._viewport
-        if not vp:
-            return None
-
-        width_scrollable = (
-            self.always_overscroll and self.do_scroll_x
-        ) or vp.width > self.width
-        height_scrollable = (
-            self.always_overscroll and self.do_scroll_y
-        ) or vp.height > self.height
-
-        if (
-            self.effect_x
-            and self.do_scroll_y
-            and height_scrollable
-            and btn in self._MOUSE_WHEEL_VERTICAL
-        ):
-            return self.effect_x if in_bar_x else self.effect_y
-        elif (
-            self.effect_y
-            and self.do_scroll_x
-            and width_scrollable
-            and btn in self._MOUSE_WHEEL_HORIZONTAL
-        ):
-            return self.effect_y if in_bar_y else self.effect_x
-        return None
-
-    def _apply_wheel_scroll(self, effect, btn, distance):
+    def _apply_wheel_scroll(self, effect, is_increase, distance):
         # Apply wheel scroll movement to the selected effect.
         self._update_effect_bounds()
 
-        if btn in self._MOUSE_WHEEL_DECREASE:
+        if not is_increase:
             if self.smooth_scroll_end:
                 effect.velocity -= distance * self.smooth_scroll_end
             else:
                 if self.always_overscroll:
                     effect.value = effect.value - distance
                 else:
-                    effect.value = max(effect.value - distance, effect.max)
+                    value = effect.value - distance
+                    lo = effect.max
+                    effect.value = value if value > lo else lo
                 effect.velocity = 0
-        elif btn in self._MOUSE_WHEEL_INCREASE:
+        else:
             if self.smooth_scroll_end:
                 effect.velocity += distance * self.smooth_scroll_end
             else:
                 if self.always_overscroll:
                     effect.value = effect.value + distance
                 else:
-                    effect.value = min(effect.value + distance, effect.min)
+                    value = effect.value + distance
+                    hi = effect.min
+                    effect.value = value if value < hi else hi
                 effect.velocity = 0
 
     def _handle_scrollbar_jump(self, touch, in_bar_x, in_bar_y):
@@ -1972,15 +2043,23 @@ class ScrollView(StencilView):
 
     def _initialize_scroll_effects(self, touch, in_bar):
         # Initialize scroll effects for both axes if enabled.
-        if self.do_scroll_x and self.effect_x and not in_bar:
-            self._update_effect_bounds()
+        if in_bar:
+            return
+        effect_x = self.effect_x if self.do_scroll_x else None
+        effect_y = self.effect_y if self.do_scroll_y else None
+        if not (effect_x or effect_y):
+            return
+
+        # Bounds cover both axes, compute them once
+        self._update_effect_bounds()
+
+        if effect_x:
             self._effect_x_start_width = self.width
-            self.effect_x.start(touch.x)
+            effect_x.start(touch.x)
 
-        if self.do_scroll_y and self.effect_y and not in_bar:
-            self._update_effect_bounds()
+        if effect_y:
             self._effect_y_start_height = self.height
-            self.effect_y.start(touch.y)
+            effect_y.start(touch.y)
 
     def _should_delegate_orthogonal(self, touch, parent_sv):
         # Check if touch movement is orthogonal to scroll direction.
@@ -1996,28 +2075,25 @@ class ScrollView(StencilView):
         #
         # Returns:
         #     bool: True if should delegate to parent
-        abs_dx = abs(touch.dx)
-        abs_dy = abs(touch.dy)
+        dx = touch.dx
+        dy = touch.dy
+        abs_dx = dx if dx >= 0 else -dx
+        abs_dy = dy if dy >= 0 else -dy
 
         # Only delegate if movement is SIGNIFICANTLY orthogonal
         # (2x threshold to avoid noise)
-        # AND parent scrollview CAN scroll in that direction
+        # AND parent scrollview CAN scroll in that direction.
+        # Orthogonal means each ScrollView scrolls exactly one axis and they
+        # differ, so the parent's do_scroll_x alone says which axis the
+        # child can't handle but the parent can.
 
         # Horizontal movement that child can't handle, but parent can
-        if (
-            abs_dx > abs_dy * 2
-            and not self.do_scroll_x
-            and parent_sv.do_scroll_x
-        ):
-            return True
+        if abs_dx > abs_dy + abs_dy:
+            return parent_sv.do_scroll_x
 
         # Vertical movement that child can't handle, but parent can
-        if (
-            abs_dy > abs_dx * 2
-            and not self.do_scroll_y
-            and parent_sv.do_scroll_y
-        ):
-            return True
+        if abs_dy > abs_dx + abs_dx:
+            return not parent_sv.do_scroll_x
 
         return False
 
@@ -2038,11 +2114,12 @@ class ScrollView(StencilView):
         # Calculate total movement since touch_down
         total_dx = touch.x - touch.ox
         total_dy = touch.y - touch.oy
-        abs_dx = abs(total_dx)
-        abs_dy = abs(total_dy)
+        abs_dx = total_dx if total_dx >= 0 else -total_dx
+        abs_dy = total_dy if total_dy >= 0 else -total_dy
 
         # Need minimum movement to determine direction
-        if abs_dx < self.scroll_distance and abs_dy < self.scroll_distance:
+        scroll_distance = self.scroll_distance
+        if abs_dx < scroll_distance and abs_dy < scroll_distance:
             return False
 
         # Determine dominant drag direction
@@ -2050,14 +2127,14 @@ class ScrollView(StencilView):
         is_vertical_dominant = abs_dy > abs_dx
 
         # Check parent-exclusive axes (immediate delegation)
-        outer_exclusive = axis_config.get("outer_exclusive", [])
+        outer_exclusive = axis_config.get("outer_exclusive", ())
         if is_horizontal_dominant and "x" in outer_exclusive:
             return True
         if is_vertical_dominant and "y" in outer_exclusive:
             return True
 
         # Check child-exclusive axes (no delegation, child continues)
-        inner_exclusive = axis_config.get("inner_exclusive", [])
+        inner_exclusive = axis_config.get("inner_exclusive", ())
         if is_horizontal_dominant and "x" in inner_exclusive:
             return False
         if is_vertical_dominant and "y" in inner_exclusive:
@@ -2095,8 +2172,9 @@ class ScrollView(StencilView):
             return False
 
         # Get per-ScrollView delegation mode (arbitrary depth support)
-        sv_uid = self._get_uid()
-        delegation_modes = touch.ud["nested"].get("delegation_modes", {})
+        sv_uid = self._uid_sv
+        nested = touch.ud["nested"]
+        delegation_modes = nested.get("delegation_modes")
 
         # For arbitrary depth: use per-ScrollView mode
         # (default UNLOCKED if not set)
@@ -2108,116 +2186,100 @@ class ScrollView(StencilView):
             )
         else:
             # No per-ScrollView modes (2-level legacy) - use global mode
-            delegation_mode = touch.ud["nested"].get(
+            delegation_mode = nested.get(
                 "delegation_mode", DelegationMode.UNLOCKED
             )
 
         # If not in delegation mode, never lock
-        if delegation_mode == DelegationMode.UNLOCKED:
+        if delegation_mode is DelegationMode.UNLOCKED:
             return False
 
         # If already locked, keep it locked (child doesn't scroll,
         # stays locked for this gesture)
-        if delegation_mode == DelegationMode.LOCKED:
+        if delegation_mode is DelegationMode.LOCKED:
             return True
 
         # delegation_mode == START_AT_BOUNDARY
         # Web-style: Started at boundary, now check movement direction
         primary_axis = self._get_primary_scroll_axis(touch)
 
-        if primary_axis == "x" and self.do_scroll_x:  # Horizontal scrolling
-            at_boundary = self._is_at_scroll_boundary("x")
-            scrolling_beyond = self._is_scrolling_beyond_boundary("x", touch)
-
-            # Check if we've moved away from the boundary into content
-            if not at_boundary:
-                # Moved away from boundary into content -
-                # UNLOCK for this gesture
-                sv_uid = self._get_uid()
-                if "delegation_modes" in touch.ud["nested"]:
-                    touch.ud["nested"]["delegation_modes"][
-                        sv_uid
-                    ] = DelegationMode.UNLOCKED
-                touch.ud["nested"]["delegation_mode"] = DelegationMode.UNLOCKED
+        if primary_axis == _AXIS_X:  # Horizontal
+            if not self.do_scroll_x:
                 return False
-
-            # Still at boundary - check if trying to scroll beyond
-            if scrolling_beyond:
-                # Trying to overscroll - DELEGATE to parent (chain delegation)
-                return True  # Delegate to parent
-
-        elif primary_axis == "y" and self.do_scroll_y:  # Vertical scrolling
-            at_boundary = self._is_at_scroll_boundary("y")
-            scrolling_beyond = self._is_scrolling_beyond_boundary("y", touch)
-
-            # Check if we've moved away from the boundary into content
-            if not at_boundary:
-                # Moved away from boundary into content, UNLOCK for this gesture
-                sv_uid = self._get_uid()
-                if "delegation_modes" in touch.ud["nested"]:
-                    touch.ud["nested"]["delegation_modes"][
-                        sv_uid
-                    ] = DelegationMode.UNLOCKED
-                touch.ud["nested"]["delegation_mode"] = DelegationMode.UNLOCKED
+            at_boundary = self._is_at_x_boundary()
+        elif primary_axis == _AXIS_Y:  # Vertical
+            if not self.do_scroll_y:
                 return False
-
-            # Still at boundary - check if trying to scroll beyond
-            if scrolling_beyond:
-                # Trying to overscroll - DELEGATE to parent (chain delegation)
-                return True  # Delegate to parent
-
-        return False
-
-    def _process_scroll_axis_x(self, touch, not_in_bar):
-        # Process X-axis scroll movement.
-        if (
-            touch.ud["sv.handled"]["x"]
-            or not self.do_scroll_x
-            or not self.effect_x
-        ):
+            at_boundary = self._is_at_y_boundary()
+        else:
             return False
 
-        width = self.width
-        if touch.ud["in_bar_x"]:
-            if self.hbar[1] != 1:
-                dx = touch.dx / float(width - width * self.hbar[1])
-                self.scroll_x = min(max(self.scroll_x + dx, 0.0), 1.0)
-                self._trigger_update_from_scroll()
-        elif not_in_bar:
-            self.effect_x.update(touch.x)
-
-        touch.ud["sv.handled"]["x"] = True
-        touch.ud["sv.can_defocus"] = False
-        return True
-
-    def _process_scroll_axis_y(self, touch, not_in_bar):
-        # Process Y-axis scroll movement.
-        if (
-            touch.ud["sv.handled"]["y"]
-            or not self.do_scroll_y
-            or not self.effect_y
-        ):
+        # Check if we've moved away from the boundary into content
+        if not at_boundary:
+            # Moved away from boundary into content, UNLOCK for this gesture
+            if delegation_modes is not None:
+                delegation_modes[sv_uid] = DelegationMode.UNLOCKED
+            nested["delegation_mode"] = DelegationMode.UNLOCKED
             return False
 
-        height = self.height
-        if touch.ud["in_bar_y"] and self.vbar[1] != 1.0:
-            dy = touch.dy / float(height - height * self.vbar[1])
-            self.scroll_y = min(max(self.scroll_y + dy, 0.0), 1.0)
-            self._trigger_update_from_scroll()
-        elif not_in_bar:
-            self.effect_y.update(touch.y)
-            self._trigger_update_from_scroll()
-
-        touch.ud["sv.handled"]["y"] = True
-        touch.ud["sv.can_defocus"] = False
-        return True
+        # Still at boundary - trying to overscroll DELEGATES to parent
+        # (chain delegation)
+        return self._is_scrolling_beyond_boundary(primary_axis, touch)
+
+    def _process_scroll_axes(self, touch, in_bar_x, in_bar_y, not_in_bar):
+        # Process X and Y axis scroll movement in a single pass.
+        # The in_bar flags (and their combined not_in_bar) are resolved by
+        # the caller. No explicit content update is needed: scroll_x/scroll_y
+        # changes (direct or through the effects) already fire the next-frame
+        # update trigger, which coalesces them into one update_from_scroll
+        # per frame.
+        ud = touch.ud
+        handled = ud["sv.handled"]
+        scrolled = False
+
+        effect_x = self.effect_x
+        if not handled["x"] and self.do_scroll_x and effect_x:
+            if in_bar_x:
+                hbar_size = self.hbar[1]
+                if hbar_size != 1:
+                    width = self.width
+                    dx = touch.dx / float(width - width * hbar_size)
+                    sx = self.scroll_x + dx
+                    self.scroll_x = 0.0 if sx < 0.0 else 1.0 if sx > 1.0 else sx
+            elif not_in_bar:
+                effect_x.update(touch.x)
+            handled["x"] = scrolled = True
+
+        effect_y = self.effect_y
+        if not handled["y"] and self.do_scroll_y and effect_y:
+            if in_bar_y:
+                vbar_size = self.vbar[1]
+                if vbar_size != 1.0:
+                    height = self.height
+                    dy = touch.dy / float(height - height * vbar_size)
+                    sy = self.scroll_y + dy
+                    self.scroll_y = 0.0 if sy < 0.0 else 1.0 if sy > 1.0 else sy
+            elif not_in_bar:
+                effect_y.update(touch.y)
+            handled["y"] = scrolled = True
+
+        if scrolled:
+            ud["sv.can_defocus"] = False
 
     def _stop_scroll_effects(self, touch, not_in_bar):
-        if self.do_scroll_x and self.effect_x and not_in_bar:
-            self.effect_x.stop(touch.x)
+        if not not_in_bar:
+            return
+        effect_x = self.effect_x
+        effect_y = self.effect_y
 
-        if self.do_scroll_y and self.effect_y and not_in_bar:
-            self.effect_y.stop(touch.y)
+        # Only effects still tracking a gesture need stopping; an effect
+        # already stopped (e.g. by a delegation cascade) would otherwise
+        # recompute its fling velocity from stale history.
+        if self.do_scroll_x and effect_x and effect_x.is_manual:
+            effect_x.stop(touch.x)
+
+        if self.do_scroll_y and effect_y and effect_y.is_manual:
+            effect_y.stop(touch.y)
 
     def _finalize_scroll_for_cascade(self, touch):
         # Finalize scroll when cascading to parent,
@@ -2232,7 +2294,7 @@ class ScrollView(StencilView):
         self._touch = None
 
         # Get scroll state
-        uid = self._get_uid()
+        uid = self._uid_sv
         if uid not in touch.ud:
             return  # Never initialized, nothing to finalize
 
@@ -2244,18 +2306,12 @@ class ScrollView(StencilView):
         ud["_finalized_for_cascade"] = True
 
         # Stop scroll effects (prevent stuck scroll)
-        not_in_bar = not touch.ud.get("in_bar_x", False) and not touch.ud.get(
-            "in_bar_y", False
-        )
+        not_in_bar = not ud["in_bar_x"] and not ud["in_bar_y"]
         self._stop_scroll_effects(touch, not_in_bar)
 
         # Schedule velocity check for on_scroll_stop event
-        if ud["mode"] == ScrollMode.SCROLL or ud.get("scroll_action"):
-            if self._velocity_check_ev:
-                self._velocity_check_ev.cancel()
-            self._velocity_check_ev = Clock.schedule_interval(
-                self._check_velocity_for_stop, 1 / 60.0
-            )
+        if ud["mode"] is ScrollMode.SCROLL or ud.get("scroll_action"):
+            self._schedule_velocity_check()
 
         # CRITICAL: Remove our uid from touch.ud so on_touch_up will delegate
         # to children. This ensures buttons and other child widgets receive
@@ -2265,17 +2321,12 @@ class ScrollView(StencilView):
 
         # Clean up svavoid flag (but KEEP claimed_by_child flag -
         # it's needed for on_touch_up!)
-        svavoid_key = self._get_uid("svavoid")
+        svavoid_key = self._uid_svavoid
         if svavoid_key in touch.ud:
             del touch.ud[svavoid_key]
 
         # Update effect bounds
-        ev = self._update_effect_bounds_ev
-        if ev is None:
-            ev = self._update_effect_bounds_ev = Clock.create_trigger(
-                self._update_effect_bounds
-            )
-        ev()
+        self._trigger_update_effect_bounds()
 
         # CRITICAL: Trigger bar fade animation since _scroll_finalize
         # won't be called (our uid was deleted above,
@@ -2299,8 +2350,9 @@ class ScrollView(StencilView):
     # -----------------------------
     # ScrollView uses 'sv.' prefixed keys via _get_uid() to create
     # instance-specific keys like 'sv.123', where 123 is the widget's
-    # unique ID. Each ScrollView only checks its own keys - they do NOT
-    # share or coordinate via these keys.
+    # unique ID. The keys are built once in __init__ and stored as
+    # self._uid_sv and self._uid_svavoid. Each ScrollView only checks its
+    # own keys - they do NOT share or coordinate via these keys.
     #
     # Per-ScrollView Instance Keys:
     # - sv.<uid>: Primary state dict for this ScrollView instance
@@ -2317,6 +2369,11 @@ class ScrollView(StencilView):
     #       'frames': int,       # Clock.frames at touch start (timing)
     #       'can_defocus': bool, # Whether this touch can defocus
     #                            # focused widgets
+    #       'in_bar_x': bool,    # Touch started on horizontal scroll bar
+    #       'in_bar_y': bool,    # Touch started on vertical scroll bar
+    #       'last_move': tuple,  # (time_update, pos) of the last move
+    #                            # processed while scrolling (optional,
+    #                            # used to drop repeat dispatches)
     #     }
     #
     # - svavoid.<uid>: Flag indicating this ScrollView should avoid
@@ -2332,8 +2389,8 @@ class ScrollView(StencilView):
     # Cross-ScrollView Shared Keys:
     # - sv.handled: dict {'x': bool, 'y': bool}
     #   Purpose: Tracks which axes have been processed by a ScrollView
-    #   Lifecycle: Set at start of on_touch_move, updated during scroll
-    #   processing
+    #   Lifecycle: Reset at start of on_touch_move (the dict is reused
+    #   across moves), updated during scroll processing
     #
     # - sv.claimed_by_child: bool
     #   Set when: _change_touch_mode delegates touch to children and
@@ -2352,6 +2409,16 @@ class ScrollView(StencilView):
     #   Set to False when: Touch results in actual scrolling
     #   Used in: on_touch_up to prevent defocus after scroll gestures
     #
+    # - sv.active: bool
+    #   Purpose: Some ScrollView created scroll state (an sv.<uid>
+    #   entry) for this touch during the gesture
+    #   Set when: An sv.<uid> entry is created. Never cleared, so it
+    #   stays set after the entry is removed on a hand-off (cascade to a
+    #   parent, or a child claiming the touch). It does not mean that an
+    #   sv.<uid> entry still exists.
+    #   Used in: on_touch_move, to tell a touch that is part of a scroll
+    #   gesture from one no ScrollView has taken up
+    #
     # NESTED SCROLLVIEW NAMESPACE
     # (Arbitrary Depth Support):
     # -------------------------------------------------------
@@ -2384,17 +2451,22 @@ class ScrollView(StencilView):
     #   Lifecycle: Set once by first hierarchy to complete, checked by
     #   all ScrollViews
     #
-    # GLOBAL SCROLLBAR FLAGS
-    # (No Namespacing Required):
+    # - sv_is_wheel: bool
+    #   Whether the touch is a mouse wheel event
+    #   Set when: First asked through _is_wheel_touch, usually on touch
+    #   down. The button of a touch never changes, so every ScrollView
+    #   reuses the cached answer.
+    #
+    # SCROLLBAR FLAGS
     # --------------------------------------------------
-    # - in_bar_x: bool - Touch started on horizontal scroll bar
-    # - in_bar_y: bool - Touch started on vertical scroll bar
+    # - in_bar_x / in_bar_y live in the sv.<uid> dict above
     #   Purpose: Differentiates bar dragging from content scrolling
     #   Affects: Touch routing, effect handling, movement calculations,
     #   delegation
-    #   Rationale: Scroll bars are positioned at widget edges and cannot
-    #   overlap, so multiple ScrollViews can safely share these global
-    #   flags
+    #   Set once in _scroll_initialize together with the rest of the
+    #   per-touch state. ScrollViews that take over a touch through
+    #   delegation start with both flags False, delegation only happens
+    #   for content drags.
 
     # =========================================================================
     # MAIN TOUCH HANDLING METHODS (in lifecycle order)
@@ -2406,13 +2478,15 @@ class ScrollView(StencilView):
         # This method automatically detects nested ScrollView configurations and
         # sets up coordination.
 
-        if not self.collide_point(*touch.pos):
+        # Inlined collide_point, this runs for every touch down in the window
+        x, y = touch.pos
+        if not (self.x <= x <= self.right and self.y <= y <= self.top):
             return False
 
         # Check if we already have an active nested ScrollView touch
         # This prevents multiple ScrollViews from scrolling simultaneously
         if self._nested_sv_active_touch is not None:
-            touch.ud[self._get_uid("svavoid")] = True
+            touch.ud[self._uid_svavoid] = True
             return False
 
         # NESTED DETECTION via touch event flow:
@@ -2428,7 +2502,7 @@ class ScrollView(StencilView):
         in_bar_x, in_bar_y = self._check_scroll_bounds(touch)
         if in_bar_x or in_bar_y:
             # Touch is on our scrollbar - handle it directly
-            if self._scroll_initialize(touch):
+            if self._scroll_initialize(touch, (in_bar_x, in_bar_y)):
                 touch.grab(self)
                 return True
             return False
@@ -2437,9 +2511,7 @@ class ScrollView(StencilView):
         # Build full hierarchy (supports arbitrary depth nesting)
         hierarchy = self._build_hierarchy_recursive(touch)
 
-        is_wheel = "button" in touch.profile and touch.button.startswith(
-            "scroll"
-        )
+        is_wheel = self._is_wheel_touch(touch)
 
         if hierarchy:
             # We're the OUTER ScrollView with nested children
@@ -2501,28 +2573,29 @@ class ScrollView(StencilView):
                         at_boundary_x = (
                             child_sv.do_scroll_x
                             and parent_sv.do_scroll_x
-                            and child_sv._is_at_scroll_boundary("x")
+                            and child_sv._is_at_x_boundary()
                         )
                         at_boundary_y = (
                             child_sv.do_scroll_y
                             and parent_sv.do_scroll_y
-                            and child_sv._is_at_scroll_boundary("y")
+                            and child_sv._is_at_y_boundary()
                         )
 
                         if at_boundary_x or at_boundary_y:
-                            child_uid = child_sv._get_uid()
-                            if "delegation_modes" not in touch.ud["nested"]:
-                                touch.ud["nested"]["delegation_modes"] = {}
-                            touch.ud["nested"]["delegation_modes"][
-                                child_uid
-                            ] = DelegationMode.START_AT_BOUNDARY
+                            modes = touch.ud["nested"].setdefault(
+                                "delegation_modes", {}
+                            )
+                            modes[child_sv._uid_sv] = (
+                                DelegationMode.START_AT_BOUNDARY
+                            )
 
             return result
 
         # We're STANDALONE - no parent, no child ScrollView found
-        if self._scroll_initialize(touch):
+        # The touch is still in our parent space, reuse the bar test
+        if self._scroll_initialize(touch, (in_bar_x, in_bar_y)):
             # Only grab if we actually set up scroll state
-            uid = self._get_uid()
+            uid = self._uid_sv
             if uid in touch.ud:
                 # We set up scroll state -
                 # claim this touch to ensure only one active touch
@@ -2531,12 +2604,12 @@ class ScrollView(StencilView):
             return True
         return False
 
-    def _scroll_initialize(self, touch):
+    def _scroll_initialize(self, touch, in_bar_flags=None):
         # This is the first phase of the scroll gesture, call from on_touch_down
         # it is used to determine if the scrollview should handle the touch
         # and to initialize the scroll effects
-        if "nested" in touch.ud and "hierarchy" in touch.ud["nested"]:
-            is_inner = touch.ud["nested"]["hierarchy"].inner == self
+        # in_bar_flags: (in_bar_x, in_bar_y) already computed by
+        # on_touch_down for this touch position, or None to compute them
 
         # Check if this touch was claimed by a child widget (e.g., button)
         # If so, don't initialize scrolling
@@ -2546,14 +2619,15 @@ class ScrollView(StencilView):
         # Skip collision check if we're the inner in a nested setup and parent
         # already validated (parent called us directly after finding us
         # with _find_child_scrollview_at_touch)
+        nested = touch.ud.get("nested")
         skip_collision = (
-            "nested" in touch.ud
-            and "hierarchy" in touch.ud["nested"]
-            and touch.ud["nested"]["hierarchy"].inner == self
+            nested is not None
+            and "hierarchy" in nested
+            and nested["hierarchy"].inner is self
         )
 
         if not skip_collision and not self.collide_point(*touch.pos):
-            touch.ud[self._get_uid("svavoid")] = True
+            touch.ud[self._uid_svavoid] = True
             return False
 
         if self.disabled:
@@ -2562,9 +2636,7 @@ class ScrollView(StencilView):
         if self._touch:
             # Already handling a touch - reject this one to enforce single-touch
             # EXCEPT for mouse wheel events which are independent
-            is_wheel = "button" in touch.profile and touch.button.startswith(
-                "scroll"
-            )
+            is_wheel = self._is_wheel_touch(touch)
             if not is_wheel:
                 # Check if stored touch is stale (completed but not cleaned up)
                 # This happens when a touch completes via hierarchy handling but
@@ -2597,30 +2669,25 @@ class ScrollView(StencilView):
         vp = self._viewport
         if not vp:
             return True
-        scroll_type = self.scroll_type
         ud = touch.ud
 
         # Check if touch is in scroll bars and set in_bar flags
-        in_bar_x, in_bar_y = self._check_scroll_bounds(touch)
+        if in_bar_flags is None:
+            in_bar_flags = self._check_scroll_bounds(touch)
+        in_bar_x, in_bar_y = in_bar_flags
         in_bar = in_bar_x or in_bar_y
-        ud["in_bar_x"] = in_bar_x
-        ud["in_bar_y"] = in_bar_y
 
-        if "button" in touch.profile and touch.button.startswith("scroll"):
+        if self._is_wheel_touch(touch):
             if self._handle_mouse_wheel_scroll(
                 touch.button, in_bar_x, in_bar_y
             ):
-                touch.ud[self._get_uid("svavoid")] = True
+                touch.ud[self._uid_svavoid] = True
                 # Start velocity check for scroll stop after mouse wheel
-                if self._velocity_check_ev:
-                    self._velocity_check_ev.cancel()
-                self._velocity_check_ev = Clock.schedule_interval(
-                    self._check_velocity_for_stop, 1 / 60.0
-                )
+                self._schedule_velocity_check()
                 return True
             return False
 
-        if scroll_type == ["bars"] and not in_bar:
+        if self._scroll_type_bars_only and not in_bar:
             return self._simulate_touch_down(touch)
 
         if in_bar:
@@ -2632,7 +2699,7 @@ class ScrollView(StencilView):
         # this touch.
         self._touch = touch
         # Set the touch state for this touch
-        uid = self._get_uid()
+        uid = self._uid_sv
         ud[uid] = {
             "mode": ScrollMode.UNKNOWN,
             "dx": 0,
@@ -2640,7 +2707,10 @@ class ScrollView(StencilView):
             "scroll_action": in_bar,
             "frames": Clock.frames,
             "can_defocus": True,  # Default: allow defocus unless scrolling
+            "in_bar_x": in_bar_x,
+            "in_bar_y": in_bar_y,
         }
+        ud["sv.active"] = True
 
         # Initialize scroll effects for content scrolling
         self._initialize_scroll_effects(touch, in_bar)
@@ -2649,9 +2719,7 @@ class ScrollView(StencilView):
         self._setup_boundary_delegation(touch, in_bar)
 
         if not in_bar:
-            Clock.schedule_once(
-                self._change_touch_mode, self.scroll_timeout / 1000.0
-            )
+            self._schedule_change_touch_mode(self.scroll_timeout / 1000.0)
         return True
 
     def on_touch_move(self, touch):
@@ -2663,8 +2731,8 @@ class ScrollView(StencilView):
 
         # NESTED COORDINATION: Check if we have hierarchy data
         nested_data = touch.ud.get("nested")
-        if nested_data and "hierarchy" in nested_data:
-            hierarchy = nested_data["hierarchy"]
+        hierarchy = nested_data.get("hierarchy") if nested_data else None
+        if hierarchy is not None:
             current_index = nested_data["current_index"]
 
             # Only the OUTER ScrollView coordinates the hierarchy
@@ -2684,7 +2752,7 @@ class ScrollView(StencilView):
             # Route to current handler
             if current_sv is self:
                 # We (outer) are handling - process normally
-                touch.ud["sv.handled"] = {"x": False, "y": False}
+                self._reset_handled_axes(touch.ud)
                 return self._scroll_update(touch)
             else:
                 # Another ScrollView in hierarchy is handling
@@ -2693,7 +2761,7 @@ class ScrollView(StencilView):
                 while True:
                     current_sv = hierarchy.scrollviews[current_index]
 
-                    touch.ud["sv.handled"] = {"x": False, "y": False}
+                    self._reset_handled_axes(touch.ud)
                     touch.push()
                     touch.apply_transform_2d(current_sv.parent.to_widget)
                     result = current_sv._scroll_update(touch)
@@ -2713,13 +2781,13 @@ class ScrollView(StencilView):
 
                         # Check if we should skip to a non-adjacent
                         # parallel ancestor
-                        if "parallel_ancestor_index" in nested_data:
+                        # (one-time use, popped as it is read)
+                        new_index = nested_data.pop(
+                            "parallel_ancestor_index", None
+                        )
+                        if new_index is not None:
                             # Non-adjacent parallel delegation
                             # (e.g., V->H->V, skip H, go to outer V)
-                            new_index = nested_data["parallel_ancestor_index"]
-                            del nested_data[
-                                "parallel_ancestor_index"
-                            ]  # One-time use
 
                             # Finalize any intermediate ScrollViews that we're
                             # skipping over
@@ -2729,7 +2797,7 @@ class ScrollView(StencilView):
                                 current_index - 1, new_index, -1
                             ):
                                 skipped_sv = hierarchy.scrollviews[skip_idx]
-                                skipped_uid = skipped_sv._get_uid()
+                                skipped_uid = skipped_sv._uid_sv
                                 if skipped_uid in touch.ud:
                                     # This intermediate ScrollView has touch
                                     # data - clean it up
@@ -2751,7 +2819,7 @@ class ScrollView(StencilView):
                         parent_sv = hierarchy.scrollviews[current_index]
 
                         # Initialize parent's scroll state if not already set up
-                        parent_uid = parent_sv._get_uid()
+                        parent_uid = parent_sv._uid_sv
                         if parent_uid not in touch.ud:
                             # Set to UNKNOWN so parent can detect scroll
                             # intent on next move
@@ -2762,7 +2830,10 @@ class ScrollView(StencilView):
                                 "scroll_action": False,
                                 "frames": 0,
                                 "can_defocus": False,
+                                "in_bar_x": False,
+                                "in_bar_y": False,
                             }
+                            touch.ud["sv.active"] = True
                             # Transform touch to parent's space before
                             # initializing effects
                             touch.push()
@@ -2805,23 +2876,34 @@ class ScrollView(StencilView):
                         return False
 
         # STANDALONE: Standard single-touch processing
-        # Only process our designated touch
+        # Only process our designated touch. The identity checks run first,
+        # the grab check must stay after the _touch check so touches we do
+        # not own still reach our children.
         if self._touch is not touch:
-            return self._delegate_to_children(touch, "on_touch_move")
+            return self._delegate_touch_move_to_children(touch)
 
         if touch.grab_current is not self:
             return True
 
-        # Verify we have established scroll state for this touch
-        if not any(
-            isinstance(key, str) and key.startswith("sv.") for key in touch.ud
-        ):
-            return self._delegate_to_children(touch, "on_touch_move")
+        # Verify we have established scroll state for this touch, ours or
+        # that of another ScrollView in the gesture
+        ud = touch.ud
+        if self._uid_sv not in ud and "sv.active" not in ud:
+            return self._delegate_touch_move_to_children(touch)
 
         # Process the scroll movement
-        touch.ud["sv.handled"] = {"x": False, "y": False}
+        self._reset_handled_axes(ud)
         return self._scroll_update(touch)
 
+    def _reset_handled_axes(self, ud):
+        # Clear the shared sv.handled flags before a move is processed,
+        # reusing the dict from the previous move instead of allocating one.
+        handled = ud.get("sv.handled")
+        if handled is None:
+            ud["sv.handled"] = {"x": False, "y": False}
+        else:
+            handled["x"] = handled["y"] = False
+
     def _scroll_update(self, touch):
         # Second phase of scroll gesture -
         # updates scroll effects during movement.
@@ -2830,41 +2912,56 @@ class ScrollView(StencilView):
         # and axis-specific scroll processing.
 
         # Early rejection checks
-        if self._get_uid("svavoid") in touch.ud:
+        touch_ud = touch.ud
+        if self._uid_svavoid in touch_ud:
             return False
-        if touch.ud.get("sv.claimed_by_child", False):
+        if touch_ud.get("sv.claimed_by_child", False):
             # Child widget claimed touch - propagate through widget tree
             return super(ScrollView, self).on_touch_move(touch)
 
         # Allow this touch to defocus focused widgets (default behavior)
-        touch.ud["sv.can_defocus"] = True
+        touch_ud["sv.can_defocus"] = True
 
         # Verify we have scroll state for this touch
-        uid = self._get_uid()
-        if uid not in touch.ud:
+        ud = touch_ud.get(self._uid_sv)
+        if ud is None:
             self._touch = False
             return self._scroll_initialize(touch)
 
         # Detect scroll intent (unknown -> scroll mode transition)
-        ud = touch.ud[uid]
-
-        if ud["mode"] == ScrollMode.UNKNOWN:
+        if ud["mode"] is ScrollMode.UNKNOWN:
             if not self._detect_scroll_intent(touch, ud):
                 return False
 
         # Process active scrolling
-        if ud["mode"] == ScrollMode.SCROLL:
-            not_in_bar = not touch.ud["in_bar_x"] and not touch.ud["in_bar_y"]
-
-            # Check if inner should delegate to outer
-            if self._check_nested_delegation(touch, not_in_bar):
+        if ud["mode"] is ScrollMode.SCROLL:
+            # Drop repeat dispatches of the same move event (a nested
+            # ScrollView can see one move in both the coordination and the
+            # grab pass). A new event keeps going even when the finger held
+            # still, so the effects record the pause in their velocity
+            # history and the delegation check still runs.
+            move = (touch.time_update, touch.pos)
+            if move == ud.get("last_move"):
+                return True
+            ud["last_move"] = move
+
+            in_bar_x = ud["in_bar_x"]
+            in_bar_y = ud["in_bar_y"]
+            not_in_bar = not in_bar_x and not in_bar_y
+
+            # Check if inner should delegate to outer. Standalone touches and
+            # scrollbar drags never delegate, skip the call for them.
+            if (
+                not_in_bar
+                and "nested" in touch_ud
+                and self._check_nested_delegation(touch, not_in_bar)
+            ):
                 return (
                     False  # Delegate to outer (on_touch_move will switch mode)
                 )
 
             # Process scroll movement for each axis
-            self._process_scroll_axis_x(touch, not_in_bar)
-            self._process_scroll_axis_y(touch, not_in_bar)
+            self._process_scroll_axes(touch, in_bar_x, in_bar_y, not_in_bar)
         return True
 
     def on_touch_up(self, touch):
@@ -2879,8 +2976,8 @@ class ScrollView(StencilView):
         # condition. If the timeout fires during on_touch_up
         # processing, child widgets can grab the touch too late and
         # never receive on_touch_up (stuck button bug)
-        if self._touch is touch:
-            Clock.unschedule(self._change_touch_mode)
+        if self._touch is touch and self._change_touch_mode_ev:
+            self._change_touch_mode_ev.cancel()
 
         # FAST PATH: If ANY nested hierarchy already completed on_touch_up,
         # skip processing. This prevents duplicate processing when
@@ -2893,8 +2990,8 @@ class ScrollView(StencilView):
 
         # NESTED COORDINATION: Check if we have hierarchy data
         nested_data = touch.ud.get("nested")
-        if nested_data and "hierarchy" in nested_data:
-            hierarchy = nested_data["hierarchy"]
+        hierarchy = nested_data.get("hierarchy") if nested_data else None
+        if hierarchy is not None:
             current_index = nested_data["current_index"]
 
             # Only the OUTER ScrollView coordinates
@@ -2907,18 +3004,18 @@ class ScrollView(StencilView):
             current_sv = hierarchy.scrollviews[current_index]
 
             # Check if current handler has scroll state
-            current_uid = current_sv._get_uid()
+            current_uid = current_sv._uid_sv
             has_state = current_uid in touch.ud
 
             # Finalize the current handler
             if current_sv is self:
                 # We (outer) were handling - finalize normally
                 self._scroll_finalize(touch)
-                self._handle_focus_behavior(touch, self._get_uid())
+                self._handle_focus_behavior(touch, self._uid_sv)
             else:
                 # Another ScrollView in hierarchy was handling
                 # Transform and finalize it
-                current_uid = current_sv._get_uid()
+                current_uid = current_sv._uid_sv
                 if current_uid in touch.ud:
                     touch.push()
                     touch.apply_transform_2d(current_sv.parent.to_widget)
@@ -2962,7 +3059,7 @@ class ScrollView(StencilView):
             return False
 
         # STANDALONE: Handle touch release
-        uid_key = self._get_uid()
+        uid_key = self._uid_sv
 
         # Touch was handled by this ScrollView
         if uid_key in touch.ud:
@@ -2972,19 +3069,18 @@ class ScrollView(StencilView):
             if self._nested_sv_active_touch is touch:
                 self._nested_sv_active_touch = None
 
-            # Release grab if we still have it (handlers may have released it)
-            gl = touch.grab_list or []
-            if any(w() is self for w in gl):
-                touch.ungrab(self)
+            # Release grab if we still have it (handlers may have released it).
+            # ungrab() is a no-op when we are no longer in the grab list.
+            touch.ungrab(self)
 
             self._handle_focus_behavior(touch, uid_key)
 
             return True
 
         # Touch not handled by us - delegate to children
-        uid = self._get_uid("svavoid")
+        uid = self._uid_svavoid
         if self._touch is not touch and uid not in touch.ud:
-            return self._delegate_to_children(touch, "on_touch_up")
+            return self._delegate_touch_up_to_children(touch)
 
         # Final fallback: finalize and ungrab
         if self._scroll_finalize(touch):
@@ -3005,33 +3101,29 @@ class ScrollView(StencilView):
         # Case 2: UID not in touch.ud - we never initialized scroll state
         # (touch went to child widget)
         if (
-            self._get_uid("svavoid") in touch.ud
-            or self._get_uid() not in touch.ud
+            self._uid_svavoid in touch.ud
+            or self._uid_sv not in touch.ud
         ):
             return False
 
-        uid = self._get_uid()
+        uid = self._uid_sv
         ud = touch.ud[uid]
 
         # Determine if this was a scroll bar interaction
-        not_in_bar = not touch.ud["in_bar_x"] and not touch.ud["in_bar_y"]
+        not_in_bar = not ud["in_bar_x"] and not ud["in_bar_y"]
         # Stop scroll effects if they were active (not for bar interactions)
         self._stop_scroll_effects(touch, not_in_bar)
 
         # Start checking for velocity-based stop if this was a scroll
         # this is used to dispatch the on_scroll_stop event
-        if ud["mode"] == ScrollMode.SCROLL or ud["scroll_action"]:
-            if self._velocity_check_ev:
-                self._velocity_check_ev.cancel()
-            self._velocity_check_ev = Clock.schedule_interval(
-                self._check_velocity_for_stop, 1 / 60.0
-            )
+        if ud["mode"] is ScrollMode.SCROLL or ud["scroll_action"]:
+            self._schedule_velocity_check()
 
         # CLICK PASSTHROUGH LOGIC
         # If the gesture never transitioned from UNKNOWN to SCROLL mode,
         # it means the user made a tap/click rather than a scroll gesture.
         # We need to simulate the click for child widgets to handle.
-        if ud["mode"] == ScrollMode.UNKNOWN:
+        if ud["mode"] is ScrollMode.UNKNOWN:
             # Only simulate click if no scroll action occurred
             # (e.g., no scroll bar interaction or dragging)
             if not ud["scroll_action"]:
@@ -3042,19 +3134,14 @@ class ScrollView(StencilView):
             Clock.schedule_once(partial(self._do_touch_up, touch), 0.2)
 
         # Update effect bounds after scroll completion
-        ev = self._update_effect_bounds_ev
-        if ev is None:
-            ev = self._update_effect_bounds_ev = Clock.create_trigger(
-                self._update_effect_bounds
-            )
-        ev()
+        self._trigger_update_effect_bounds()
 
         # Always accept mouse wheel events
-        if "button" in touch.profile and touch.button.startswith("scroll"):
+        if self._is_wheel_touch(touch):
             return True
 
         # Return whether we had any involvement with this touch
-        return self._get_uid() in touch.ud
+        return self._uid_sv in touch.ud
 
     def scroll_to(self, widget, padding=10, animate=True):
         """Scrolls the viewport to ensure that the given widget is visible,
@@ -3068,35 +3155,51 @@ class ScrollView(StencilView):
         if not self.parent:
             return
 
-        # if _viewport is layout and has pending operation, reschedule
-        if hasattr(self._viewport, "do_layout"):
+        # if _viewport is layout and has pending operation, reschedule.
+        # Requests made while waiting collapse into the latest one.
+        if self._viewport_has_layout:
             if self._viewport._trigger_layout.is_triggered:
-                Clock.schedule_once(
-                    lambda *dt: self.scroll_to(widget, padding, animate)
-                )
+                self._scroll_to_args = (widget, padding, animate)
+                ev = self._scroll_to_ev
+                if ev is None:
+                    ev = self._scroll_to_ev = Clock.create_trigger(
+                        self._deferred_scroll_to, release_ref=False
+                    )
+                ev()
                 return
 
         if isinstance(padding, (int, float)):
             padding = (padding, padding)
+        pad_x, pad_y = dp(padding[0]), dp(padding[1])
 
-        pos = self.parent.to_widget(*widget.to_window(*widget.pos))
-        cor = self.parent.to_widget(*widget.to_window(widget.right, widget.top))
+        to_widget = self.parent.to_widget
+        to_window = widget.to_window
+        wx, wy = widget.pos
+        ww, wh = widget.size
+        pos = to_widget(*to_window(wx, wy))
+        cor = to_widget(*to_window(wx + ww, wy + wh))
 
         dx = dy = 0
+        x, y = self.pos
+        width, height = self.size
+        right, top = x + width, y + height
 
-        if pos[1] < self.y:
-            dy = self.y - pos[1] + dp(padding[1])
-        elif cor[1] > self.top:
-            dy = self.top - cor[1] - dp(padding[1])
+        if pos[1] < y:
+            dy = y - pos[1] + pad_y
+        elif cor[1] > top:
+            dy = top - cor[1] - pad_y
 
-        if pos[0] < self.x:
-            dx = self.x - pos[0] + dp(padding[0])
-        elif cor[0] > self.right:
-            dx = self.right - cor[0] - dp(padding[0])
+        if pos[0] < x:
+            dx = x - pos[0] + pad_x
+        elif cor[0] > right:
+            dx = right - cor[0] - pad_x
 
         dsx, dsy = self.convert_distance_to_scroll(dx, dy)
-        sxp = min(1, max(0, self.scroll_x - dsx))
-        syp = min(1, max(0, self.scroll_y - dsy))
+        # Clamp to [0, 1] with comparisons instead of min/max calls
+        sxp = self.scroll_x - dsx
+        sxp = 0.0 if sxp < 0.0 else 1.0 if sxp > 1.0 else sxp
+        syp = self.scroll_y - dsy
+        syp = 0.0 if syp < 0.0 else 1.0 if syp > 1.0 else syp
 
         # Stop any existing motion before starting new animation
         if self.effect_x:
@@ -3113,6 +3216,13 @@ class ScrollView(StencilView):
             self.scroll_x = sxp
             self.scroll_y = syp
 
+    def _deferred_scroll_to(self, *largs):
+        # Replay the latest scroll_to request once the layout has run.
+        args = self._scroll_to_args
+        self._scroll_to_args = None
+        if args is not None:
+            self.scroll_to(*args)
+
     def convert_distance_to_scroll(self, dx, dy):
         """Convert a distance in pixels to a scroll distance, depending on the
         content size and the scrollview size.
@@ -3120,19 +3230,13 @@ class ScrollView(StencilView):
         The result will be a tuple of scroll distance that can be added to
         :data:`scroll_x` and :data:`scroll_y`
         """
-        if not self._viewport:
-            return 0, 0
         vp = self._viewport
-        if vp.width > self.width:
-            sw = vp.width - self.width
-            sx = dx / float(sw)
-        else:
-            sx = 0
-        if vp.height > self.height:
-            sh = vp.height - self.height
-            sy = dy / float(sh)
-        else:
-            sy = 1
+        if not vp:
+            return 0, 0
+        width, height = self.size
+        vw, vh = vp.size
+        sx = dx / float(vw - width) if vw > width else 0
+        sy = dy / float(vh - height) if vh > height else 1
         return sx, sy
 
     def update_from_scroll(self, *largs):
@@ -3144,59 +3248,77 @@ class ScrollView(StencilView):
         if the size of the content changes.
         """
         if not self._viewport:
-            self.g_translate.xy = self.pos
+            self._set_translate(*self.pos)
             return
         vp = self._viewport
-
-        # update from size_hint
-        if vp.size_hint_x is not None:
-            w = vp.size_hint_x * self.width
-            if vp.size_hint_min_x is not None:
-                w = max(w, vp.size_hint_min_x)
-            if vp.size_hint_max_x is not None:
-                w = min(w, vp.size_hint_max_x)
-            vp.width = w
-
-        if vp.size_hint_y is not None:
-            h = vp.size_hint_y * self.height
-            if vp.size_hint_min_y is not None:
-                h = max(h, vp.size_hint_min_y)
-            if vp.size_hint_max_y is not None:
-                h = min(h, vp.size_hint_max_y)
-            vp.height = h
-
-        if vp.width > self.width or self.always_overscroll:
-            sw = vp.width - self.width
-            x = self.x - self.scroll_x * sw
+        width, height = self.size
+
+        # update from size_hint, only assigning sizes that actually change
+        shx, shy = vp.size_hint
+        if shx is not None:
+            w = shx * width
+            smin, smax = vp.size_hint_min_x, vp.size_hint_max_x
+            if smin is not None and w < smin:
+                w = smin
+            if smax is not None and w > smax:
+                w = smax
+            if w != vp.width:
+                vp.width = w
+
+        if shy is not None:
+            h = shy * height
+            smin, smax = vp.size_hint_min_y, vp.size_hint_max_y
+            if smin is not None and h < smin:
+                h = smin
+            if smax is not None and h > smax:
+                h = smax
+            if h != vp.height:
+                vp.height = h
+
+        # Read the settled sizes once for both axes
+        vw, vh = vp.size
+        always_overscroll = self.always_overscroll
+        x, y = self.pos
+
+        if vw > width or always_overscroll:
+            x -= self.scroll_x * (vw - width)
+
+        if vh > height or always_overscroll:
+            y -= self.scroll_y * (vh - height)
         else:
-            x = self.x
-
-        if vp.height > self.height or self.always_overscroll:
-            sh = vp.height - self.height
-            y = self.y - self.scroll_y * sh
-        else:
-            y = self.top - vp.height
+            y += height - vh
 
         # from 1.8.0, we now use a matrix by default, instead of moving the
         # widget position behind. We set it here, but it will be a no-op most
         # of the time.
         vp.pos = 0, 0
-        self.g_translate.xy = x, y
+        self._set_translate(x, y)
 
         # New in 1.2.0, show bar when scrolling happens and (changed in 1.9.0)
         # fade to bar_inactive_color when no scroll is happening.
         ev = self._bind_inactive_bar_color_ev
         if ev is None:
             ev = self._bind_inactive_bar_color_ev = Clock.create_trigger(
-                self._bind_inactive_bar_color, 0.5
+                self._bind_inactive_bar_color, 0.5, release_ref=False
             )
-        self.funbind("bar_inactive_color", self._change_bar_color)
-        Animation.stop_all(self, "_bar_color")
-        self.fbind("bar_color", self._change_bar_color)
-        self._bar_color = self.bar_color
+        # Switch to the active color only when coming from the inactive
+        # state, there is no fade animation to stop while already active.
+        if not self._bar_color_active:
+            self._bar_color_active = True
+            self.funbind("bar_inactive_color", self._change_bar_color)
+            Animation.stop_all(self, "_bar_color")
+            self.fbind("bar_color", self._change_bar_color)
+            self._bar_color = self.bar_color
         ev()
 
+    def _set_translate(self, x, y):
+        # Move the content and keep the cached translation in sync.
+        self._tx = x
+        self._ty = y
+        self.g_translate.xy = x, y
+
     def _bind_inactive_bar_color(self, *args):
+        self._bar_color_active = False
         self.funbind("bar_color", self._change_bar_color)
         self.fbind("bar_inactive_color", self._change_bar_color)
         Animation(
@@ -3214,6 +3336,7 @@ class ScrollView(StencilView):
         super(ScrollView, self).add_widget(widget, *args, **kwargs)
         self.canvas = canvas
         self._viewport = widget
+        self._viewport_has_layout = hasattr(widget, "do_layout")
         widget.bind(
             size=self._trigger_update_from_scroll,
             size_hint_min=self._trigger_update_from_scroll,
@@ -3227,29 +3350,37 @@ class ScrollView(StencilView):
         self.canvas = canvas
         if widget is self._viewport:
             self._viewport = None
+            self._viewport_has_layout = False
 
     def _on_scroll_pos_changed(self, instance, value):
         # Called when scroll_x or scroll_y changes.
-        # Dispatches on_scroll_move event to notify listeners of
-        # actual scroll position changes.
+        # Schedules the content reposition and the on_scroll_move event.
+        # Both triggers run once before the next frame, however many times
+        # the position changed in between.
+        self._trigger_update_from_scroll()
+        self._trigger_scroll_move()
+
+    def _dispatch_scroll_move(self, *largs):
+        # Notify listeners that the scroll position changed this frame.
         self.dispatch("on_scroll_move")
 
     def _check_position_stable(self, dt):
         # Check if scroll position has stabilized. Used to dispatch the
         # on_scroll_stop event.
-        current_pos = (self.scroll_x, self.scroll_y)
+        sx = self.scroll_x
+        sy = self.scroll_y
+        last_sx = self._last_sx
 
-        if self._last_scroll_pos is None:
-            self._last_scroll_pos = current_pos
+        if last_sx is None:
+            self._last_sx = sx
+            self._last_sy = sy
             self._stable_frames = 0
             return True
 
         # Check if position changed
-        pos_changed = not (
-            isclose(current_pos[0], self._last_scroll_pos[0])
-            and isclose(current_pos[1], self._last_scroll_pos[1])
-        )
-        if not pos_changed:
+        dsx = sx - last_sx
+        dsy = sy - self._last_sy
+        if -1e-9 < dsx < 1e-9 and -1e-9 < dsy < 1e-9:
             # Position hasn't changed - increment stable counter
             self._stable_frames += 1
 
@@ -3260,20 +3391,39 @@ class ScrollView(StencilView):
                 if self._position_check_ev:
                     self._position_check_ev.cancel()
                 self._position_check_ev = None
-                self._last_scroll_pos = None
+                self._last_sx = self._last_sy = None
                 self._stable_frames = 0
                 return False
         else:
             # Position still changing - reset counter
-            self._last_scroll_pos = current_pos
+            self._last_sx = sx
+            self._last_sy = sy
             self._stable_frames = 0
 
         return True
 
+    def _schedule_velocity_check(self):
+        # (Re)start the velocity check for on_scroll_stop at the fastest rate
+        ev = self._velocity_check_ev
+        if ev is None:
+            ev = self._velocity_check_ev = Clock.create_trigger(
+                self._check_velocity_for_stop,
+                _VELOCITY_CHECK_MIN,
+                release_ref=False,
+            )
+        else:
+            ev.cancel()
+        self._velocity_check_interval = ev.timeout = _VELOCITY_CHECK_MIN
+        self._last_check_speed = None
+        ev()
+
     def _check_velocity_for_stop(self, dt):
         # Used to dispatch the on_scroll_stop event.
         # Checks if velocity is zero. After detecting zero velocity,
         # we verify the position has stabilized before dispatching.
+        # While the velocity keeps decaying the check backs off, doubling
+        # its interval up to _VELOCITY_CHECK_MAX, so a long fling is not
+        # polled every frame. Any speed-up resets it to every frame.
 
         # Get current velocities
         vel_x = self.effect_x.velocity if self.effect_x else 0
@@ -3282,21 +3432,32 @@ class ScrollView(StencilView):
         # Use small threshold for velocity check
         if isclose(vel_x, 0.0) and isclose(vel_y, 0.0):
             # Velocity is zero - now check position stability
-            if self._velocity_check_ev:
-                self._velocity_check_ev.cancel()
-            self._velocity_check_ev = None
+            self._velocity_check_ev.cancel()
+            self._last_check_speed = None
 
             # Start position stability check
-            self._last_scroll_pos = None
+            self._last_sx = self._last_sy = None
             self._stable_frames = 0
             if self._position_check_ev:
                 self._position_check_ev.cancel()
             self._position_check_ev = Clock.schedule_interval(
                 self._check_position_stable, 0
             )
-            return False
+            return
 
-        return True
+        speed = abs(vel_x) + abs(vel_y)
+        last_speed = self._last_check_speed
+        interval = self._velocity_check_interval
+        if last_speed is not None and speed <= last_speed:
+            interval *= 2.0
+            if interval > _VELOCITY_CHECK_MAX:
+                interval = _VELOCITY_CHECK_MAX
+        else:
+            interval = _VELOCITY_CHECK_MIN
+        self._last_check_speed = speed
+        ev = self._velocity_check_ev
+        self._velocity_check_interval = ev.timeout = interval
+        ev()
 
     def _get_uid(self, prefix="sv"):
         # UNIQUE IDENTIFIER GENERATOR FOR TOUCH.UD KEYS
@@ -3310,7 +3471,20 @@ class ScrollView(StencilView):
         #
         # This ensures each ScrollView instance has its own namespace in
         # touch.ud, preventing conflicts in nested scenarios.
-        return "{0}.{1}".format(prefix, self.uid)
+        # Called once from __init__, use self._uid_sv / self._uid_svavoid.
+        # The keys are interned so touch.ud lookups match by identity.
+        return intern("{0}.{1}".format(prefix, self.uid))
+
+    def _is_wheel_touch(self, touch):
+        # Check if the touch is a mouse wheel event, cached in touch.ud.
+        ud = touch.ud
+        is_wheel = ud.get("sv_is_wheel")
+        if is_wheel is None:
+            is_wheel = ud["sv_is_wheel"] = (
+                "button" in touch.profile
+                and touch.button in self._MOUSE_WHEEL_CLASS
+            )
+        return is_wheel
 
     def _get_debug_name(self):
         # Helper method for debug output - identifies ScrollView by scroll axes
@@ -3322,6 +3496,19 @@ class ScrollView(StencilView):
         axis_str = "+".join(axes) if axes else "NONE"
         return f"SV[{axis_str}:{self.uid}]"
 
+    def _schedule_change_touch_mode(self, timeout):
+        # (Re)arm the single gesture timeout trigger. Any pending run is
+        # cancelled first so the new timeout always applies.
+        ev = self._change_touch_mode_ev
+        if ev is None:
+            ev = self._change_touch_mode_ev = Clock.create_trigger(
+                self._change_touch_mode, release_ref=False
+            )
+        else:
+            ev.cancel()
+        ev.timeout = timeout
+        ev()
+
     def _change_touch_mode(self, *largs):
         # SCROLL TIMEOUT HANDLER - GESTURE DETECTION TIMEOUT
         # ==================================================
@@ -3332,7 +3519,7 @@ class ScrollView(StencilView):
         if not self._touch:
             return
 
-        uid = self._get_uid()
+        uid = self._uid_sv
         touch = self._touch
         if uid not in touch.ud:
             self._touch = False
@@ -3340,7 +3527,7 @@ class ScrollView(StencilView):
 
         ud = touch.ud[uid]
         # Only proceed if we're still in gesture detection mode
-        if ud["mode"] != ScrollMode.UNKNOWN or ud["scroll_action"]:
+        if ud["mode"] is not ScrollMode.UNKNOWN or ud["scroll_action"]:
             return
 
         # SLOW DEVICE PROTECTION:
@@ -3350,7 +3537,7 @@ class ScrollView(StencilView):
         if self.slow_device_support:
             diff_frames = Clock.frames - ud["frames"]
             if diff_frames < 3:
-                Clock.schedule_once(self._change_touch_mode, 0)
+                self._schedule_change_touch_mode(0)
                 return
 
         # CLEANUP AND HANDOFF:
@@ -3382,8 +3569,11 @@ class ScrollView(StencilView):
         # NOTE: Do NOT schedule _do_touch_up here, this is a live touch handoff,
         # not a synthetic click. The user is still holding their finger down.
         touch.push()
-        touch.apply_transform_2d(self.to_widget)
-        touch.apply_transform_2d(self.to_parent)
+        # to_widget followed by to_parent cancels our own content translation,
+        # so the composed transform is just the parent's window-to-widget one
+        parent = self.parent
+        if parent is not None:
+            touch.apply_transform_2d(parent.to_widget)
 
         child_grabbed = self._simulate_touch_down(touch)
 
@@ -3391,7 +3581,7 @@ class ScrollView(StencilView):
 
         if child_grabbed:
             # A child widget grabbed the touch - hand it off completely
-            uid = self._get_uid()
+            uid = self._uid_sv
             if uid in touch.ud:
                 del touch.ud[uid]
 
@@ -3410,7 +3600,7 @@ class ScrollView(StencilView):
             # No child grabbed it (e.g., user is on empty space) -
             # transition to SCROLL mode so the user can begin scrolling without
             # restarting the gesture
-            uid = self._get_uid()
+            uid = self._uid_sv
             if uid in touch.ud:
                 touch.ud[uid]["mode"] = ScrollMode.SCROLL
                 # Dispatch on_scroll_start since we're now ready to scroll
@@ -3424,16 +3614,21 @@ class ScrollView(StencilView):
         # grabbed this touch.
         # Ensures proper cleanup for buttons/widgets that were touched
         # during scroll gestures touch is in window coords
-        self._delegate_touch_up_to_children_widget_coords(touch)
+        delegate = self._delegate_touch_up_to_children_widget_coords
+        delegate(touch)
         # don't forget about grab event!
-        for x in touch.grab_list[:]:
-            touch.grab_list.remove(x)
+        # Detach all grabs in one step instead of an O(n) remove per entry,
+        # dispatching in the original grab order
+        grab_list = touch.grab_list
+        grabbed = grab_list[:]
+        del grab_list[:]
+        for x in grabbed:
             x = x()
             if not x:
                 continue
             touch.grab_current = x
             # touch is in window coords
-            self._delegate_touch_up_to_children_widget_coords(touch)
+            delegate(touch)
         touch.grab_current = None
 
     def on_scroll_start(self):
@@ -3465,7 +3660,8 @@ class ScrollView(StencilView):
 
         This event fires continuously during scrolling and is useful for
         implementing scroll-based animations, progress indicators, or parallax
-        effects.
+        effects. Changes made within one frame are coalesced into a
+        single dispatch before the next frame is drawn.
 
         .. versionchanged:: NEXT_VERSION
             Removed touch parameter. Use on_touch_down/move/up for touch-specific
@@ -3502,10 +3698,7 @@ if __name__ == "__main__":
 
         def build(self):
             layout1 = GridLayout(cols=4, spacing=10, size_hint=(None, None))
-            layout1.bind(
-                minimum_height=layout1.setter("height"),
-                minimum_width=layout1.setter("width"),
-            )
+            layout1.bind(minimum_size=layout1.setter("size"))
             for i in range(40):
                 btn = Button(
                     text=str(i), size_hint=(None, None), size=(200, 100)
@@ -3515,10 +3708,7 @@ if __name__ == "__main__":
             scrollview1.add_widget(layout1)
 
             layout2 = GridLayout(cols=4, spacing=10, size_hint=(None, None))
-            layout2.bind(
-                minimum_height=layout2.setter("height"),
-                minimum_width=layout2.setter("width"),
-            )
+            layout2.bind(minimum_size=layout2.setter("size"))
             for i in range(40):
                 btn = Button(
                     text=str(i), size_hint=(None, None), size=(200, 100)